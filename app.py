@@ -2,35 +2,108 @@
 Open‑Access Paper Finder — Streamlit Web App (Dark‑mode friendly) + PubMed + Keyword Analytics
 
 For NCBI, include an email to be a good API citizen: set `NCBI_EMAIL` in Streamlit secrets or edit HEADERS.
+Optionally set `NCBI_API_KEY` too, which raises the E-utilities limit from 3 to 10 requests/s.
 """
 
 from __future__ import annotations
+import asyncio
+import hashlib
+import html
+import io
+import math
+import operator
 import os
 import re
+import sqlite3
+import threading
 import time
 import json
+import logging
 from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, List, Dict, Any, Optional, Tuple
+from xml.etree import ElementTree
 
-import requests
+import httpx
 import pandas as pd
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from records import FIELDS, Record, record_tuple
+
+try:
+    from lxml import etree  # type: ignore
+except ImportError:  # arXiv parsing falls back to feedparser
+    etree = None
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # stdlib json fallback; orjson only speeds up (de)serialisation
+    orjson = None
+
+# Decode JSON response bodies straight from bytes
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 # -----------------------------
 # Constants & Config
 # -----------------------------
+log = logging.getLogger("oapf")
+
 APP_TITLE = "Open‑Access Paper Finder"
 OPENALEX_BASE = "https://api.openalex.org/works"
-ARXIV_BASE = "http://export.arxiv.org/api/query"
+ARXIV_BASE = "https://export.arxiv.org/api/query"
 NCBI_EUTILS = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+# OpenAlex basic (page=) paging only reaches the first 10,000 results; beyond that use cursors
+OPENALEX_PAGE_LIMIT = 10_000
+# Only the Work fields _norm_openalex reads; OpenAlex otherwise ships ~80 per work
+OPENALEX_SELECT = "id,doi,title,publication_year,authorships,primary_location,best_oa_location,abstract_inverted_index"
+
+# Namespace-qualified Atom tags used when parsing arXiv responses
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+ATOM_ENTRY = f"{ATOM_NS}entry"
+ATOM_TITLE = f"{ATOM_NS}title"
+ATOM_SUMMARY = f"{ATOM_NS}summary"
+ATOM_PUBLISHED = f"{ATOM_NS}published"
+ATOM_LINK = f"{ATOM_NS}link"
+ATOM_AUTHOR = f"{ATOM_NS}author"
+ATOM_NAME = f"{ATOM_NS}name"
+ARXIV_DOI = "{http://arxiv.org/schemas/atom}doi"
+
+# Publication years: first 19xx/20xx in a PubMed pubdate ("2019 Mar 5"), leading year of an Atom timestamp
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+_DATE_RE = re.compile(r"(\d{4})-")
 
 CONTACT_EMAIL = st.secrets.get("NCBI_EMAIL", "youremail@example.com")
+NCBI_API_KEY = st.secrets.get("NCBI_API_KEY")
+# E-utilities allow 3 requests/s per client, 10/s with an API key
+NCBI_RATE = 10 if NCBI_API_KEY else 3
 
 HEADERS = {
     "User-Agent": f"OpenAccessFinder/1.3 (mailto:{CONTACT_EMAIL})"
 }
 
+# Shared client settings: fail fast on connect, allow slow responses, keep connections warm
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+HTTP_RETRIES = 2  # connect errors only; HTTP status errors are never retried
+
+# Persistent HTTP response cache (survives Streamlit restarts). "Newest first" sorts
+# go stale quickly, so they get a short lifetime; everything else is kept for a day.
+HTTP_CACHE_DIR = ".cache"
+CACHE_TTL_FRESH = 15 * 60
+CACHE_TTL_DEFAULT = 24 * 60 * 60
+CACHE_PRUNE_INTERVAL = 10 * 60  # expired rows are deleted at most this often
+FRESH_SORTS = {"publication_year:desc", "lastUpdatedDate:desc", "submittedDate:desc", "pub+date"}
+
+# Requests/s allowed in OpenAlex's polite pool
+OPENALEX_RATE = 10
+
+# Max in-flight requests per backend host, shared process-wide (OpenAlex and NCBI slots
+# are also held 1 s, see _get)
+HOST_CONCURRENCY = {"OpenAlex": OPENALEX_RATE, "arXiv": 1, "PubMed": NCBI_RATE}
+
 st.set_page_config(page_title=APP_TITLE, page_icon="📚", layout="wide")
 
 # -----------------------------
@@ -56,67 +129,221 @@ CUSTOM_CSS = """
 </style>
 """
 
-st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
-
-# Header (theme-aware)
-st.markdown(
-    f"""
-    <div class="header-box">
-      <h1 class="header-title">📚 {APP_TITLE}</h1>
-      <p class="header-sub">Find <b>free / open‑access PDFs</b> by keyword using <b>OpenAlex</b>, <b>arXiv</b>, and <b>PubMed</b> (PMC). Export results to CSV/JSON — and analyze top keywords.</p>
-    </div>
-    """,
-    unsafe_allow_html=True,
+# One result card per line; fields are filled in (HTML-escaped) by _escape()
+CARD_TEMPLATE = (
+    "<div class='result-card'>"
+    "<div class='result-title'><a href=\"{href}\" target=\"_blank\">{title}</a></div>"
+    "<div style='color:#bbb'>{authors}</div>"
+    "<div class='meta'>{venue} • {year} • <span class='badge'>{source}</span></div>"
+    "<div class='linkline' style='margin-top:6px;'>{links}</div>"
+    "</div>"
 )
+PDF_LINK = "<a href='{}' target='_blank'>📄 PDF</a>"
+DOI_LINK = "<a href='https://doi.org/{}' target='_blank'>DOI</a>"
+
+HEADER_HTML = f"""
+<div class="header-box">
+  <h1 class="header-title">📚 {APP_TITLE}</h1>
+  <p class="header-sub">Find <b>free / open‑access PDFs</b> by keyword using <b>OpenAlex</b>, <b>arXiv</b>, and <b>PubMed</b> (PMC). Export results to CSV/JSON — and analyze top keywords.</p>
+</div>
+"""
+
+FOOTER_HTML = """
+<div style="margin-top:1rem; font-size:0.9rem; color:#888;">
+⚖️ This app avoids scraping Google Scholar directly. It queries OpenAlex & arXiv APIs and NCBI E‑utilities for PubMed, preferring PubMed Central PDFs. Keyword analytics use titles and (where available) abstracts.
+</div>
+"""
+
+
+@st.cache_resource
+def _static_chrome() -> Tuple[str, str]:
+    """(CSS + header, footer) HTML, assembled once per server process."""
+    return CUSTOM_CSS + HEADER_HTML, FOOTER_HTML
+
+
+# CSS and header (theme-aware) in one element
+st.markdown(_static_chrome()[0], unsafe_allow_html=True)
 
 # -----------------------------
 # Helpers for keyword analytics
 # -----------------------------
-STOPWORDS = set(
+STOPWORDS = frozenset(
     '''a an and are as at be but by for from in into is it its of on or s the to with we our this that these those over under using used via new study review approach method results conclusion conclusions based between among toward towards among within across without has have had were was being been into about against among each other more most many much further less least than then there their they them he she you your i we us such while during before after according however therefore whereas whereas overall background objective objectives materials methods discussion discussions result results conclusion conclusions paper article preprint open access data code model models figure figures table tables supplementary supplementarymaterial materials available online link links'''.split()
 )
 
 TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z\-]{2,}")
+_FINDALL = TOKEN_RE.findall
 
 
 def normalize_text(text: str) -> List[str]:
-    words = [w.lower() for w in TOKEN_RE.findall(text or "")]
-    words = [w.strip("-'") for w in words]
-    return [w for w in words if w and w not in STOPWORDS]
+    """Lowercased, edge-stripped, non-stopword tokens of text (one pass, one list)."""
+    if not text:
+        return []
+    out: List[str] = []
+    append = out.append
+    for w in _FINDALL(text):
+        w = w.lower().strip("-'")
+        if w and w not in STOPWORDS:
+            append(w)
+    return out
 
 
 def abstract_from_openalex(inv_idx: Optional[Dict[str, List[int]]]) -> str:
     """Reconstruct OpenAlex abstract text from inverted index map."""
     if not inv_idx:
         return ""
-    # inv_idx maps token -> positions
-    # Build by placing each token at its positions, then join by spaces
-    maxpos = 0
-    for positions in inv_idx.values():
-        if positions:
-            maxpos = max(maxpos, max(positions))
-    out = [""] * (maxpos + 1)
-    for token, positions in inv_idx.items():
-        for p in positions:
-            if 0 <= p < len(out):
-                out[p] = token
-    return " ".join([t for t in out if t])
+    # inv_idx maps token -> positions; one pass to position -> token, then join in position order
+    by_pos = {p: token for token, positions in inv_idx.items() if token for p in positions}
+    return " ".join([by_pos[p] for p in sorted(by_pos)])
 
 
 # -----------------------------
 # Search backends
 # -----------------------------
-@st.cache_data(show_spinner=False)
-def search_openalex(
+def _cache_ttl(sort: str) -> int:
+    return CACHE_TTL_FRESH if sort in FRESH_SORTS else CACHE_TTL_DEFAULT
+
+
+@dataclass
+class _DiskCache:
+    """The one shared response-cache connection; the lock serialises its users."""
+    conn: sqlite3.Connection
+    lock: threading.Lock
+    pruned: float = 0.0
+
+
+@st.cache_resource
+def _disk_cache() -> Optional[_DiskCache]:
+    """Open the response cache once per process (None if the cache dir is unusable)."""
+    try:
+        os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+        conn = sqlite3.connect(os.path.join(HTTP_CACHE_DIR, "http.sqlite"), timeout=5, check_same_thread=False)
+        with conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires REAL, body BLOB)")
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires)")
+    except (sqlite3.Error, OSError):
+        return None  # the cache is best-effort; every request goes to the network
+    return _DiskCache(conn, threading.Lock())
+
+
+HTTP_CACHE = _disk_cache()
+
+
+def _cache_load(key: str) -> Optional[bytes]:
+    try:
+        with HTTP_CACHE.lock:
+            row = HTTP_CACHE.conn.execute(
+                "SELECT body FROM responses WHERE key = ? AND expires > ?", (key, time.time())
+            ).fetchone()
+    except sqlite3.Error:
+        return None  # fall through to the network
+    return row[0] if row else None
+
+
+def _cache_store(key: str, body: bytes, ttl: int) -> None:
+    now = time.time()
+    try:
+        with HTTP_CACHE.lock, HTTP_CACHE.conn as conn:
+            if now - HTTP_CACHE.pruned > CACHE_PRUNE_INTERVAL:
+                conn.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+                HTTP_CACHE.pruned = now
+            conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (key, now + ttl, body))
+    except sqlite3.Error:
+        pass
+
+
+async def _get(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    url: str,
+    params: Dict[str, Any],
+    hold: float = 0.0,
+    ttl: int = 0,
+) -> httpx.Response:
+    """GET through the shared client, holding a slot of the host's semaphore.
+
+    With ``hold`` the slot is released only ``hold`` seconds after the response, so a
+    semaphore of N slots allows at most N requests per ``hold`` seconds.
+    With ``ttl`` successful bodies are kept in the on-disk cache (HTTP_CACHE), keyed on URL + params.
+    """
+    request = client.build_request("GET", url, params=params)
+    key = hashlib.sha256(str(request.url).encode()).hexdigest() if ttl and HTTP_CACHE is not None else None
+    if key:
+        # sqlite is blocking: keep it off the event loop every session shares
+        body = await asyncio.to_thread(_cache_load, key)
+        if body is not None:
+            return httpx.Response(200, content=body, request=request)
+
+    await sem.acquire()
+    try:
+        resp = await client.send(request)
+    finally:
+        if hold:
+            asyncio.get_running_loop().call_later(hold, sem.release)
+        else:
+            sem.release()
+    resp.raise_for_status()
+    if key:
+        await asyncio.to_thread(_cache_store, key, resp.content, ttl)
+    return resp
+
+
+def _ncbi_params(**params: Any) -> Dict[str, Any]:
+    """E-utilities params plus the tool/email (and optional API key) NCBI asks for."""
+    params.update(email=CONTACT_EMAIL, tool="OpenAccessFinder")
+    if NCBI_API_KEY:
+        params["api_key"] = NCBI_API_KEY
+    return params
+
+
+_EMPTY: Dict[str, Any] = {}
+_OPENALEX_FLAT = operator.itemgetter("title", "publication_year", "doi", "id")
+
+
+def _norm_openalex(w: Dict[str, Any], get=dict.get) -> Record:
+    """Flatten one OpenAlex Work into a result row (runs once per work, so it keeps lookups local)."""
+    try:
+        title, year, doi, work_id = _OPENALEX_FLAT(w)
+    except KeyError:
+        title, year, doi, work_id = get(w, "title"), get(w, "publication_year"), get(w, "doi"), get(w, "id")
+    authorships = get(w, "authorships") or ()
+    try:
+        authors = ", ".join(n for n in (a["author"]["display_name"] for a in authorships) if n)
+    except (KeyError, TypeError):
+        authors = ", ".join(n for n in (get(get(a, "author") or _EMPTY, "display_name") for a in authorships) if n)
+    best_loc = get(w, "best_oa_location") or _EMPTY
+    primary = get(w, "primary_location") or _EMPTY
+    source = get(primary, "source") or _EMPTY
+    return Record(
+        title=title,
+        authors=authors,
+        year=year,
+        venue=get(source, "display_name"),
+        doi=(doi or "").replace("https://doi.org/", ""),
+        url_pdf=get(best_loc, "pdf_url") or get(best_loc, "url"),
+        url_landing=(
+            get(primary, "landing_page_url")
+            or get(primary, "pdf_url")
+            or get(source, "host_venue_url")
+            or get(source, "url")
+            or doi
+            or work_id
+        ),
+        source="OpenAlex",
+        abstract=abstract_from_openalex(get(w, "abstract_inverted_index")),
+    )
+
+
+async def search_openalex(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
     query: str,
     year_from: Optional[int],
     year_to: Optional[int],
     max_results: int,
     sort: str = "relevance_score:desc",
-) -> List[Dict[str, Any]]:
-    results: List[Dict[str, Any]] = []
-    per_page = 50
-    retrieved = 0
+) -> List[Record]:
+    per_page = min(50, max_results)
 
     filters = ["is_oa:true"]
     if year_from:
@@ -124,82 +351,133 @@ def search_openalex(
     if year_to:
         filters.append(f"to_publication_date:{year_to}-12-31")
 
-    cursor = "*"
-    while retrieved < max_results:
-        remaining = max_results - retrieved
-        page_size = per_page if remaining > per_page else remaining
-        params = {
-            "search": query,
-            "filter": ",".join(filters),
-            "sort": sort,
-            "per-page": page_size,
-            "cursor": cursor,
-        }
-        resp = requests.get(OPENALEX_BASE, params=params, headers=HEADERS, timeout=30)
-        resp.raise_for_status()
-        data = resp.json()
-        works = data.get("results", [])
-        if not works:
-            break
-
-        for w in works:
-            best_pdf = None
-            try:
-                best_loc = w.get("best_oa_location") or {}
-                best_pdf = best_loc.get("pdf_url") or best_loc.get("url")
-            except Exception:
-                pass
-
-            authors = ", ".join(
-                a.get("author", {}).get("display_name", "") for a in (w.get("authorships") or [])
-            )
-            host = (w.get("host_venue") or {}).get("display_name")
-            primary = (w.get("primary_location") or {})
-            url_landing = (
-                primary.get("landing_page_url")
-                or primary.get("pdf_url")
-                or (primary.get("source") or {}).get("host_venue_url")
-                or (primary.get("source") or {}).get("url")
-                or w.get("doi")
-                or w.get("id")
+    base_params = {
+        "search": query,
+        "filter": ",".join(filters),
+        "sort": sort,
+        "per-page": per_page,
+        "select": OPENALEX_SELECT,
+    }
+    ttl = _cache_ttl(sort)
+    hold = 1.0  # each request keeps its slot for 1 s: at most OPENALEX_RATE requests per second
+
+    pages: List[Dict[str, Any]] = []
+    if max_results <= OPENALEX_PAGE_LIMIT:
+        # Basic paging: probe page 1 for meta.count, then fetch the other pages concurrently
+        resp = await _get(client, sem, OPENALEX_BASE, {**base_params, "page": 1}, hold=hold, ttl=ttl)
+        first = _json_loads(resp.content)
+        total = min(first.get("meta", {}).get("count") or 0, max_results)
+        n_pages = math.ceil(total / per_page)
+        rest = await asyncio.gather(
+            *(_get(client, sem, OPENALEX_BASE, {**base_params, "page": p}, hold=hold, ttl=ttl) for p in range(2, n_pages + 1))
+        )
+        pages = [first] + [_json_loads(r.content) for r in rest]
+    else:
+        # Paging past OpenAlex's basic-paging ceiling needs the (sequential) cursor
+        cursor = "*"
+        retrieved = 0
+        while cursor and retrieved < max_results:
+            resp = await _get(client, sem, OPENALEX_BASE, {**base_params, "cursor": cursor}, hold=hold, ttl=ttl)
+            data = _json_loads(resp.content)
+            if not data.get("results"):
+                break
+            pages.append(data)
+            retrieved += len(data["results"])
+            cursor = data.get("meta", {}).get("next_cursor")
+
+    works = [w for data in pages for w in data.get("results", [])][:max_results]
+    return [_norm_openalex(w) for w in works]
+
+
+def _arxiv_entries_lxml(content: bytes) -> List[Record]:
+    """Stream the <entry> elements of an arXiv Atom response through lxml's C parser."""
+    out: List[Record] = []
+    for _, entry in etree.iterparse(io.BytesIO(content), tag=ATOM_ENTRY):
+        m = _DATE_RE.match(entry.findtext(ATOM_PUBLISHED) or "")
+        year = int(m.group(1)) if m else None
+        pdf_url = None
+        landing_url = None
+        for link in entry.iterfind(ATOM_LINK):
+            if pdf_url is None and (link.get("type") == "application/pdf" or link.get("title") == "pdf"):
+                pdf_url = link.get("href")
+            elif landing_url is None and link.get("rel") == "alternate":
+                landing_url = link.get("href")
+        out.append(
+            Record(
+                title=(entry.findtext(ATOM_TITLE) or "").strip().replace("\n", " "),
+                authors=", ".join(n for n in (a.findtext(ATOM_NAME) for a in entry.iterfind(ATOM_AUTHOR)) if n),
+                year=year,
+                venue="arXiv",
+                doi=entry.findtext(ARXIV_DOI) or "",
+                url_pdf=pdf_url,
+                url_landing=landing_url,
+                source="arXiv",
+                abstract=(entry.findtext(ATOM_SUMMARY) or "").strip(),
             )
+        )
+        entry.clear()
+    return out
 
-            results.append(
-                {
-                    "title": w.get("title"),
-                    "authors": authors,
-                    "year": w.get("publication_year"),
-                    "venue": host,
-                    "doi": (w.get("doi") or "").replace("https://doi.org/", ""),
-                    "url_pdf": best_pdf,
-                    "url_landing": url_landing,
-                    "source": "OpenAlex",
-                    "_abstract": abstract_from_openalex(w.get("abstract_inverted_index")),
-                }
+
+def _arxiv_entries_feedparser(content: bytes) -> List[Record]:
+    """Fallback Atom parsing with feedparser when lxml is not installed."""
+    import feedparser  # type: ignore
+
+    out: List[Record] = []
+    # Parse the raw bytes: feedparser sniffs the encoding itself, no intermediate str decode
+    for e in feedparser.parse(content).get("entries", []):
+        title = (e.get("title") or "").strip().replace("\n", " ")
+        m = _DATE_RE.match(e.get("published") or "")
+        year = int(m.group(1)) if m else None
+        pdf_url = next(
+            (
+                link.get("href")
+                for link in e.get("links", ())
+                if link.get("type") == "application/pdf" or link.get("title") == "pdf"
+            ),
+            None,
+        )
+        landing_url = e.get("link")
+        authors = ", ".join(n for n in (a.get("name") for a in e.get("authors") or ()) if n)
+        out.append(
+            Record(
+                title=title,
+                authors=authors,
+                year=year,
+                venue="arXiv",
+                doi=e.get("arxiv_doi") or "",
+                url_pdf=pdf_url,
+                url_landing=landing_url,
+                source="arXiv",
+                abstract=(e.get("summary") or "").strip(),
             )
+        )
+    return out
 
-        retrieved += len(works)
-        cursor = data.get("meta", {}).get("next_cursor")
-        if not cursor:
-            break
-        time.sleep(0.2)
 
-    return results
+def _arxiv_parser() -> Optional[Callable[[bytes], List[Record]]]:
+    """lxml entry parser, else the (lazily imported) feedparser fallback, else None."""
+    if etree is not None:
+        return _arxiv_entries_lxml
+    try:
+        import feedparser  # type: ignore  # noqa: F401
+    except Exception:
+        return None
+    return _arxiv_entries_feedparser
 
 
-@st.cache_data(show_spinner=False)
-def search_arxiv(
+async def search_arxiv(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
     query: str,
     year_from: Optional[int],
     year_to: Optional[int],
     max_results: int,
     sort: str = "relevance:desc",
-) -> List[Dict[str, Any]]:
-    """Search arXiv for papers; lazily import feedparser to avoid hard dependency."""
-    try:
-        import feedparser  # type: ignore
-    except Exception:
-        st.error("arXiv support requires the 'feedparser' package. Add 'feedparser' to requirements.txt or pip install it locally.")
+) -> List[Record]:
+    """Search arXiv for papers; see _arxiv_parser for the XML parser used."""
+    parse_entries = _arxiv_parser()
+    if parse_entries is None:
         return []
 
     date_filter = None
@@ -214,7 +492,7 @@ def search_arxiv(
     q = " AND ".join(q_terms)
 
     per_page = 50
-    results: List[Dict[str, Any]] = []
+    results: List[Record] = []
     start_i = 0
 
     sortBy = sort.replace(":desc", "").replace(":asc", "")
@@ -229,58 +507,51 @@ def search_arxiv(
             "sortBy": sortBy,
             "sortOrder": sortOrder,
         }
-        resp = requests.get(ARXIV_BASE, params=params, headers=HEADERS, timeout=30)
-        resp.raise_for_status()
-        feed = feedparser.parse(resp.text)
-        entries = feed.get("entries", [])
+        resp = await _get(client, sem, ARXIV_BASE, params, ttl=_cache_ttl(sort))
+        entries = parse_entries(resp.content)
         if not entries:
             break
 
-        for e in entries:
-            title = (e.get("title") or "").strip().replace("\n", " ")
-            year = None
-            try:
-                year = datetime(*e.published_parsed[:6]).year if e.get("published_parsed") else None
-            except Exception:
-                pass
-            pdf_url = None
-            landing_url = e.get("link")
-            for link in e.get("links", []):
-                if link.get("type") == "application/pdf" or link.get("title") == "pdf":
-                    pdf_url = link.get("href")
-                    break
-            authors = ", ".join(a.get("name") for a in e.get("authors", []))
-            results.append(
-                {
-                    "title": title,
-                    "authors": authors,
-                    "year": year,
-                    "venue": "arXiv",
-                    "doi": e.get("arxiv_doi") or "",
-                    "url_pdf": pdf_url,
-                    "url_landing": landing_url,
-                    "source": "arXiv",
-                    "_abstract": (e.get("summary") or "").strip(),
-                }
-            )
+        results.extend(entries)
         start_i += len(entries)
         if len(entries) < count:
             break
-        time.sleep(0.2)
+        await asyncio.sleep(0.2)
 
     return results
 
 
-@st.cache_data(show_spinner=False)
-def search_pubmed(
+def _pubmed_abstracts(content: bytes) -> Dict[str, str]:
+    """PMID -> abstract text for one EFetch response, in a single streaming pass."""
+    out: Dict[str, str] = {}
+    for _, article in ElementTree.iterparse(io.BytesIO(content)):
+        if article.tag != "PubmedArticle":
+            continue
+        pmid = article.findtext("MedlineCitation/PMID")
+        if pmid:
+            out[pmid] = " \n ".join("".join(t.itertext()) for t in article.iter("AbstractText"))
+        article.clear()
+    return out
+
+
+async def search_pubmed(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
     query: str,
     year_from: Optional[int],
     year_to: Optional[int],
     max_results: int,
     sort: str = "relevance",
-) -> List[Dict[str, Any]]:
+) -> List[Record]:
     """PubMed free full text; includes PMCID PDF and fetches abstracts via EFetch (batched)."""
-    results: List[Dict[str, Any]] = []
+    # PMID -> Record fields, in ESummary order; Records are built once abstracts are in
+    found: Dict[str, Dict[str, Any]] = {}
+
+    async def eutil(name: str, **params: Any) -> httpx.Response:
+        # Every E-utilities call holds its NCBI slot for 1 s to stay under the per-second limit
+        return await _get(
+            client, sem, f"{NCBI_EUTILS}/{name}.fcgi", _ncbi_params(**params), hold=1.0, ttl=_cache_ttl(sort)
+        )
 
     term = query
     if year_from or year_to:
@@ -289,49 +560,19 @@ def search_pubmed(
         term += f" AND (\"{yf}\"[Date - Publication] : \"{yt}\"[Date - Publication])"
     term += " AND free full text[Filter]"
 
-    retstart = 0
-    per_page = 100
-    collected_pmids: List[str] = []
-
-    while len(collected_pmids) < max_results:
-        count = min(per_page, max_results - len(collected_pmids))
-        params = {
-            "db": "pubmed",
-            "term": term,
-            "retmode": "json",
-            "retmax": count,
-            "retstart": retstart,
-            "sort": sort,
-            "email": CONTACT_EMAIL,
-            "tool": "OpenAccessFinder",
-        }
-        es = requests.get(f"{NCBI_EUTILS}/esearch.fcgi", params=params, headers=HEADERS, timeout=30)
-        es.raise_for_status()
-        esj = es.json()
-        idlist = esj.get("esearchresult", {}).get("idlist", [])
-        if not idlist:
-            break
-        collected_pmids.extend(idlist)
-        retstart += len(idlist)
-        time.sleep(0.34)
-
+    # One ESearch returns the whole id list (retmax goes up to 10,000)
+    es = await eutil("esearch", db="pubmed", term=term, retmode="json", retmax=max_results, sort=sort)
+    collected_pmids: List[str] = _json_loads(es.content).get("esearchresult", {}).get("idlist", [])
     if not collected_pmids:
-        return results
-
-    # ESummary for metadata (batch)
-    for i in range(0, len(collected_pmids), 200):
-        batch = collected_pmids[i:i+200]
-        esum_params = {
-            "db": "pubmed",
-            "id": ",".join(batch),
-            "retmode": "json",
-            "email": CONTACT_EMAIL,
-            "tool": "OpenAccessFinder",
-        }
-        sm = requests.get(f"{NCBI_EUTILS}/esummary.fcgi", params=esum_params, headers=HEADERS, timeout=30)
-        sm.raise_for_status()
-        smj = sm.json()
-        res = smj.get("result", {})
+        return []
+
+    # ESummary for metadata (batches of 200 ids, fetched concurrently)
+    id_batches = [collected_pmids[i:i+200] for i in range(0, len(collected_pmids), 200)]
+    summaries = await asyncio.gather(
+        *(eutil("esummary", db="pubmed", id=",".join(batch), retmode="json", version="2.0") for batch in id_batches)
+    )
+    for batch, sm in zip(id_batches, summaries):
+        res = _json_loads(sm.content).get("result", {})
         for pmid in batch:
             item = res.get(pmid)
             if not item:
@@ -346,111 +587,198 @@ def search_pubmed(
             pdf_url = f"https://www.ncbi.nlm.nih.gov/pmc/articles/{pmcid}/pdf" if pmcid else None
             if not pdf_url:
                 continue
-            authors = ", ".join([a.get('name') for a in item.get("authors", []) if a.get("name")])
-            pubdate = item.get("pubdate", "")
-            year = None
-            for token in str(pubdate).split():
-                if token.isdigit() and len(token) == 4:
-                    year = int(token)
-                    break
-            results.append(
-                {
-                    "title": item.get("title"),
-                    "authors": authors,
-                    "year": year,
-                    "venue": item.get("fulljournalname") or item.get("source") or "PubMed",
-                    "doi": doi,
-                    "url_pdf": pdf_url,
-                    "url_landing": f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
-                    "source": "PubMed",
-                    "_pmid": pmid,
-                }
-            )
-        time.sleep(0.34)
+            authors = ", ".join(n for n in (a.get("name") for a in item.get("authors") or ()) if n)
+            m = _YEAR_RE.search(item.get("pubdate") or "")
+            year = int(m.group(0)) if m else None
+            found[pmid] = {
+                "title": item.get("title"),
+                "authors": authors,
+                "year": year,
+                "venue": item.get("fulljournalname") or item.get("source") or "PubMed",
+                "doi": doi,
+                "url_pdf": pdf_url,
+                "url_landing": f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
+                "source": "PubMed",
+            }
 
     # Fetch abstracts (optional, batched; keep light)
-    pmids_with_abs = [r["_pmid"] for r in results if r.get("_pmid")]
-    for i in range(0, len(pmids_with_abs), 100):
-        batch = pmids_with_abs[i:i+100]
-        ef_params = {
-            "db": "pubmed",
-            "id": ",".join(batch),
-            "retmode": "xml",
-            "rettype": "abstract",
-            "email": CONTACT_EMAIL,
-            "tool": "OpenAccessFinder",
-        }
-        ef = requests.get(f"{NCBI_EUTILS}/efetch.fcgi", params=ef_params, headers=HEADERS, timeout=30)
-        ef.raise_for_status()
-        xml = ef.text
-        # very light parsing: pull \n between <AbstractText> tags
-        abs_texts: Dict[str, str] = {}
-        for pmid in batch:
-            # naive extraction per PMID block
-            block_match = re.search(rf"<PubmedArticle>[\s\S]*?<PMID[^>]*>{pmid}</PMID>[\s\S]*?</PubmedArticle>", xml)
-            if not block_match:
-                continue
-            block = block_match.group(0)
-            texts = re.findall(r"<AbstractText[^>]*>([\s\S]*?)</AbstractText>", block)
-            clean = re.sub(r"<[^>]+>", " ", " \n ".join(texts))
-            abs_texts[pmid] = clean
-        for r in results:
-            if r.get("_pmid") in abs_texts:
-                r["_abstract"] = abs_texts[r["_pmid"]]
-        time.sleep(0.34)
+    pmids_with_abs = list(found)
+    abs_batches = [pmids_with_abs[i:i+100] for i in range(0, len(pmids_with_abs), 100)]
+    fetched = await asyncio.gather(
+        *(
+            eutil("efetch", db="pubmed", id=",".join(batch), retmode="xml", rettype="abstract")
+            for batch in abs_batches
+        )
+    )
+    abs_texts: Dict[str, str] = {}
+    for ef in fetched:
+        abs_texts.update(_pubmed_abstracts(ef.content))
 
-    return results
+    return [Record(**fields, abstract=abs_texts.get(pmid, "")) for pmid, fields in found.items()]
+
+
+BACKENDS = {"OpenAlex": search_openalex, "arXiv": search_arxiv, "PubMed": search_pubmed}
+
+
+@st.cache_resource
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Long-lived event loop in a daemon thread, so pooled connections outlive a single search."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="oapf-http", daemon=True).start()
+    return loop
+
+
+@st.cache_resource
+def _http_client() -> httpx.AsyncClient:
+    """Shared HTTP/2 keep-alive client for every backend; only used on _event_loop()."""
+    transport = httpx.AsyncHTTPTransport(http2=True, limits=HTTP_LIMITS, retries=HTTP_RETRIES)
+    return httpx.AsyncClient(transport=transport, headers=HEADERS, timeout=HTTP_TIMEOUT, follow_redirects=True)
+
+
+async def _make_semaphores() -> Dict[str, asyncio.Semaphore]:
+    return {name: asyncio.Semaphore(n) for name, n in HOST_CONCURRENCY.items()}
+
+
+@st.cache_resource
+def _host_semaphores() -> Dict[str, asyncio.Semaphore]:
+    """Per-host semaphores shared by every search and session, so each rate limit is process-wide.
+
+    Created on _event_loop(), the only loop they are ever awaited on.
+    """
+    return asyncio.run_coroutine_threadsafe(_make_semaphores(), _event_loop()).result()
+
+
+# (source, sort key used by sort_map, default sort) in display/merge order
+SOURCE_SORTS = (
+    ("OpenAlex", "openalex", "relevance_score:desc"),
+    ("arXiv", "arxiv", "relevance:desc"),
+    ("PubMed", "pubmed", "relevance"),
+)
+
+
+def search_plan(
+    sources: Tuple[str, ...],
+    sort_key: Tuple[str, str],
+    max_results: int,
+) -> Tuple[Tuple[str, int, str], ...]:
+    """(source, max_results, sort) per selected source; the sorted-by source gets the full budget."""
+    which, sort_value = sort_key
+    per_source = max(10, max_results // max(1, len(sources)))
+    return tuple(
+        (name, max_results if which == key else per_source, sort_value if which == key else default_sort)
+        for name, key, default_sort in SOURCE_SORTS
+        if name in sources
+    )
+
+
+def _round_up(n: int, step: int = 100) -> int:
+    return -(-n // step) * step
+
+
+# In-memory entries expire as fast as the freshest disk-cache entries; the disk cache
+# (_cache_ttl) still answers relevance sorts for a day after that.
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL_FRESH, max_entries=128)
+def search_source(
+    name: str,
+    query: str,
+    year_from: Optional[int],
+    year_to: Optional[int],
+    max_results: int,
+    sort: str,
+) -> List[Record]:
+    """Results of one backend, fetched on the shared event loop and client.
+
+    Callers pass max_results rounded up with _round_up() and slice the list down to their
+    own plan, so nudging the "Max results" slider is served from this cache. Failures
+    propagate (and are therefore never cached).
+    """
+    search = BACKENDS[name](
+        _http_client(), _host_semaphores()[name], query, year_from, year_to, max_results, sort=sort
+    )
+    return asyncio.run_coroutine_threadsafe(search, _event_loop()).result()
 
 
 # -----------------------------
 # Utilities
 # -----------------------------
 
-def dedupe_records(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    seen_doi, seen_pdf, seen_landing = set(), set(), set()
-    out = []
+def dedupe_records(rows: List[Record], seen: Optional[set] = None) -> List[Record]:
+    """Keep the first row per key: the DOI, else the PDF URL, else the landing URL.
+
+    Rows without any of the three are always kept. Pass the same `seen` set to dedupe
+    several batches incrementally against each other.
+    """
+    if seen is None:
+        seen = set()
+    add = seen.add
+    out: List[Record] = []
     for r in rows:
-        doi = (r.get("doi") or "").lower().strip()
-        pdf = (r.get("url_pdf") or "").strip()
-        land = (r.get("url_landing") or "").strip()
-        if doi and doi in seen_doi:
-            continue
-        if pdf and pdf in seen_pdf:
-            continue
-        if land and land in seen_landing:
-            continue
-        if doi:
-            seen_doi.add(doi)
-        if pdf:
-            seen_pdf.add(pdf)
-        if land:
-            seen_landing.add(land)
+        key = (r.doi or "").strip().lower() or (r.url_pdf or r.url_landing or "").strip()
+        if key:
+            if key in seen:
+                continue
+            add(key)
         out.append(r)
     return out
 
 
-def to_dataframe(rows: List[Dict[str, Any]]) -> pd.DataFrame:
-    if not rows:
-        return pd.DataFrame(columns=["title", "authors", "year", "venue", "doi", "url_pdf", "url_landing", "source"])
-    df = pd.DataFrame(rows)
-    cols = ["title", "authors", "year", "venue", "doi", "url_pdf", "url_landing", "source"]
-    for c in cols:
-        if c not in df.columns:
-            df[c] = ""
-    return df[cols]
+def to_dataframe(rows: List[Record]) -> pd.DataFrame:
+    # from_records already yields the FIELDS columns for an empty result list
+    return pd.DataFrame.from_records(map(record_tuple, rows), columns=FIELDS)
+
+
+def _escape(r: Record) -> Dict[str, Any]:
+    """HTML-escaped CARD_TEMPLATE fields for one result row."""
+    pdf = r.url_pdf
+    doi = r.doi
+    links = []
+    if pdf:
+        links.append(PDF_LINK.format(html.escape(pdf)))
+    if doi:
+        links.append(DOI_LINK.format(html.escape(doi)))
+    return {
+        "href": html.escape(r.url_landing or pdf or ""),
+        "title": html.escape(r.title or "(untitled)"),
+        "authors": html.escape(r.authors or ""),
+        "venue": html.escape(r.venue or ""),
+        "year": r.year or "",
+        "source": html.escape(r.source or ""),
+        "links": " • ".join(links),
+    }
+
 
+def _rows_key(rows: List[Record]) -> int:
+    """Cheap cache key for a result list (Records are frozen, hence hashable)."""
+    return hash(tuple(rows))
 
-def extract_keywords(rows: List[Dict[str, Any]], include_abstracts: bool = True) -> Tuple[Counter, List[str]]:
+
+@st.cache_data(show_spinner=False, ttl=60 * 60, max_entries=32)
+def make_csv(rows_key: int, _rows: List[Record]) -> bytes:
+    """CSV export bytes, written straight into a binary buffer (rebuilt only when rows_key changes)."""
+    buf = io.BytesIO()
+    to_dataframe(_rows).to_csv(buf, index=False, encoding="utf-8")
+    return buf.getvalue()
+
+
+@st.cache_data(show_spinner=False, ttl=60 * 60, max_entries=32)
+def make_json(rows_key: int, _rows: List[Record]) -> bytes:
+    """JSON export bytes (orjson serialises Records natively); rebuilt only when rows_key changes."""
+    if orjson is None:
+        return json.dumps([asdict(r) for r in _rows], indent=2).encode("utf-8")
+    return orjson.dumps(_rows, option=orjson.OPT_INDENT_2)
+
+
+@st.cache_data(show_spinner=False, ttl=60 * 60, max_entries=32)
+def extract_keywords(rows_key: int, _rows: List[Record], include_abstracts: bool = True) -> Tuple[Counter, List[str]]:
     """Return (frequency Counter, uncommon_terms list).
     Uncommon terms are words that occur once (hapax) and length ≥ 6.
+    Cached on rows_key (see _rows_key) rather than by hashing every row on each rerun.
     """
-    tokens: List[str] = []
-    for r in rows:
-        title = r.get("title") or ""
-        tokens.extend(normalize_text(title))
-        if include_abstracts and r.get("_abstract"):
-            tokens.extend(normalize_text(r.get("_abstract")))
-    freq = Counter(tokens)
+    freq: Counter = Counter()
+    for r in _rows:
+        freq.update(normalize_text(r.title))
+        if include_abstracts and r.abstract:
+            freq.update(normalize_text(r.abstract))
     uncommon = sorted([w for w, c in freq.items() if c == 1 and len(w) >= 6])
     return freq, uncommon
 
@@ -488,82 +816,100 @@ st.divider()
 # -----------------------------
 # Execute search & render
 # -----------------------------
-rows: List[Dict[str, Any]] = []
+rows: List[Record] = []
 if run:
     if not query.strip():
         st.warning("Please enter some keywords to search.")
         st.stop()
 
     with st.spinner("Searching open‑access sources…"):
-        all_rows: List[Dict[str, Any]] = []
-        which, sort_value = sort_map[sort_choice]
-        per_source = max(10, max_results // max(1, len(sources)))
-
-        if "OpenAlex" in sources:
-            oa_rows = search_openalex(
-                query, int(year_from), int(year_to),
-                per_source if which != "openalex" else max_results,
-                sort=sort_value if which == "openalex" else "relevance_score:desc",
-            )
-            all_rows.extend(oa_rows)
-
-        if "arXiv" in sources:
-            ax_rows = search_arxiv(
-                query, int(year_from), int(year_to),
-                per_source if which != "arxiv" else max_results,
-                sort=sort_value if which == "arxiv" else "relevance:desc",
-            )
-            all_rows.extend(ax_rows)
-
-        if "PubMed" in sources:
-            pm_rows = search_pubmed(
-                query, int(year_from), int(year_to),
-                per_source if which != "pubmed" else max_results,
-                sort=sort_value if which == "pubmed" else "relevance",
-            )
-            all_rows.extend(pm_rows)
-
-        rows = dedupe_records(all_rows)
-
+        rows = []
+        searched = [name for name, _, _ in SOURCE_SORTS if name in sources]
+        if "arXiv" in searched and _arxiv_parser() is None:
+            st.error("arXiv support requires the 'lxml' (or 'feedparser') package. Add it to requirements.txt or pip install it locally.")
+            searched.remove("arXiv")
+
+        searched_sources = tuple(searched)
+        sort_key = sort_map[sort_choice]
+        plan = search_plan(searched_sources, sort_key, max_results)
+
+        # This session's last search with the same query, years, sources and sort keeps each
+        # source's rows as {source: (rows fetched for, fetched at, rows)}. While fresh, a source
+        # whose new share fits is re-sliced from them (before dedupe) instead of searched again.
+        search_key = (query, int(year_from), int(year_to), searched_sources, sort_choice)
+        last = st.session_state.get("last_search")
+        kept = last[1] if last is not None and last[0] == search_key else {}
+        now = time.time()
+
+        # One worker per source; each blocks on its cached search while the others run. Fetching
+        # a rounded-up superset lets a lower "Max results" be served from search_source's cache.
+        fetched: Dict[str, List[Record]] = {}
+        fresh: Dict[str, Tuple[int, float, List[Record]]] = {}
+        seen: set = set()
+        merged = 0  # sources of plan already deduped into rows
+        ctx = get_script_run_ctx()
+        with ThreadPoolExecutor(max_workers=3, initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+            futures: Dict[Future, Tuple[str, int]] = {}
+            for name, n, sort in plan:
+                budget, fetched_at, source_rows = kept.get(name, (0, 0.0, []))
+                if n <= budget and now - fetched_at < CACHE_TTL_FRESH:
+                    future = Future()
+                    future.set_result(source_rows)
+                    futures[future] = (name, 0)  # reused: keep its original budget and time
+                    fresh[name] = kept[name]
+                else:
+                    future = executor.submit(
+                        search_source, name, query, int(year_from), int(year_to), _round_up(n), sort
+                    )
+                    futures[future] = (name, _round_up(n))
+            for future in as_completed(futures):
+                name, budget = futures[future]
+                try:
+                    fetched[name] = future.result()
+                except Exception as e:
+                    fetched[name] = []
+                    # Full error (request URL with email/api_key) only goes to the server log
+                    log.warning("%s search failed", name, exc_info=e)
+                    reason = type(e).__name__
+                    if isinstance(e, httpx.HTTPStatusError):
+                        reason = f"HTTP {e.response.status_code}"
+                    st.warning(f"{name} search failed ({reason}).")
+                else:
+                    if budget:
+                        fresh[name] = (budget, now, fetched[name])
+
+                # Dedupe sources as they arrive, but strictly in plan order, so the kept row
+                # does not depend on which source finished first
+                while merged < len(plan) and plan[merged][0] in fetched:
+                    name, n, _ = plan[merged]
+                    rows.extend(dedupe_records(fetched.pop(name)[:n], seen))
+                    merged += 1
+
+        # Failed sources are left out, so the next search retries them
+        st.session_state["last_search"] = (search_key, fresh, rows)
+
+# Results and analytics render from the last search, so widget reruns (Top N, abstracts)
+# keep them on screen and hit the keyword/export caches instead of searching again
+last = st.session_state.get("last_search")
+if last is not None:
+    rows = last[2]
     st.success(f"Found {len(rows)} unique open/free items.")
 
     if not rows:
         st.info("No results. Try broadening keywords or extending the year range.")
         st.stop()
 
-    # Results list
-    for r in rows:
-        st.markdown(
-            f"""
-            <div class='result-card'>
-              <div class='result-title'>
-                <a href="{r.get('url_landing') or r.get('url_pdf') or ''}" target="_blank">{r.get('title') or '(untitled)'}</a>
-              </div>
-              <div style='color:#bbb'>{r.get('authors') or ''}</div>
-              <div class='meta'>
-                {r.get('venue') or ''} • {r.get('year') or ''} • <span class='badge'>{r.get('source')}</span>
-              </div>
-              <div class='linkline' style='margin-top:6px;'>
-                {f"<a href='{r.get('url_pdf')}' target='_blank'>📄 PDF</a>" if r.get('url_pdf') else ""}
-                {" • " if r.get('url_pdf') and r.get('doi') else ""}
-                {f"<a href='https://doi.org/{r.get('doi')}' target='_blank'>DOI</a>" if r.get('doi') else ""}
-              </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+    # Results list (all cards in a single markdown element)
+    st.markdown("\n".join(CARD_TEMPLATE.format(**_escape(r)) for r in rows), unsafe_allow_html=True)
 
     # Export
-    df = to_dataframe(rows)
-    csv_bytes = df.to_csv(index=False).encode("utf-8")
-    json_bytes = json.dumps(rows, indent=2).encode("utf-8")
-
     exp_cols = st.columns(2)
+    rows_key = _rows_key(rows)
     exp_cols[0].download_button(
-        "⬇️ Download CSV", csv_bytes, file_name="open_access_results.csv", mime="text/csv", use_container_width=True
+        "⬇️ Download CSV", make_csv(rows_key, rows), file_name="open_access_results.csv", mime="text/csv", use_container_width=True
     )
     exp_cols[1].download_button(
-        "⬇️ Download JSON", json_bytes, file_name="open_access_results.json", mime="application/json", use_container_width=True
+        "⬇️ Download JSON", make_json(rows_key, rows), file_name="open_access_results.json", mime="application/json", use_container_width=True
     )
 
     st.divider()
@@ -576,13 +922,11 @@ if run:
     top_n = st.slider("Top N words for bar chart", 5, 40, 20)
 
     with st.spinner("Computing keyword frequencies…"):
-        freq, uncommon = extract_keywords(rows, include_abstracts=use_abs)
+        freq, uncommon = extract_keywords(rows_key, rows, include_abstracts=use_abs)
         if not freq:
             st.info("No text available to analyze (try enabling abstracts or widening sources).")
         else:
-            top_items = freq.most_common(top_n)
-            top_df = pd.DataFrame(top_items, columns=["word", "count"]).set_index("word")
-            st.bar_chart(top_df)
+            st.bar_chart(pd.Series(dict(freq.most_common(top_n)), name="count"))
 
             st.markdown("**Uncommon keywords (appear once, length ≥ 6)**")
             if uncommon:
@@ -591,11 +935,4 @@ if run:
                 st.write("— none —")
 
 # Footer
-st.markdown(
-    """
-    <div style="margin-top:1rem; font-size:0.9rem; color:#888;">
-    ⚖️ This app avoids scraping Google Scholar directly. It queries OpenAlex & arXiv APIs and NCBI E‑utilities for PubMed, preferring PubMed Central PDFs. Keyword analytics use titles and (where available) abstracts.
-    </div>
-    """,
-    unsafe_allow_html=True,
-)
+st.markdown(_static_chrome()[1], unsafe_allow_html=True)
@@ -0,0 +1,31 @@
+"""
+Result records for the Open‑Access Paper Finder.
+
+Kept out of app.py on purpose: Streamlit re-executes app.py as a fresh __main__ module on
+every run, so a class defined there changes identity between runs and cached Records could
+no longer be pickled. An imported module keeps one class object for the whole process.
+"""
+
+from __future__ import annotations
+import operator
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class Record:
+    """One search result, normalised across backends (slots keep per-row memory small)."""
+    title: Optional[str]
+    authors: str
+    year: Optional[int]
+    venue: Optional[str]
+    doi: str
+    url_pdf: Optional[str]
+    url_landing: Optional[str]
+    source: str
+    abstract: str = ""
+
+
+# Columns of the results table / CSV export
+FIELDS = ("title", "authors", "year", "venue", "doi", "url_pdf", "url_landing", "source")
+record_tuple = operator.attrgetter(*FIELDS)